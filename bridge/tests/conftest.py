@@ -0,0 +1,44 @@
+"""Shared fixtures: isolate port discovery state from the real ~/.ueserver."""
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ue_bridge import port_discovery, tcp_client
+
+
+@pytest.fixture(autouse=True)
+def ueserver_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point discovery at a temp ~/.ueserver and reset module-level caches."""
+    ueserver = tmp_path / ".ueserver"
+    ueserver.mkdir()
+
+    monkeypatch.setattr(port_discovery, "_UESERVER_DIR", str(ueserver))
+    monkeypatch.setattr(port_discovery, "_SWITCHBOARD_PATH", str(ueserver / "switchboard.json"))
+    monkeypatch.setattr(port_discovery, "_CACHE_PATH", str(ueserver / ".bridge_cache"))
+    monkeypatch.setattr(port_discovery, "_switchboard_cache", None)
+    monkeypatch.setattr(port_discovery, "_discovery_memo", None)
+    monkeypatch.setattr(port_discovery, "_pid_check_cache", {})
+    monkeypatch.setattr(tcp_client, "_idle_connections", {})
+    return ueserver
+
+
+@pytest.fixture
+def write_switchboard(ueserver_dir: Path) -> Callable[[list[dict[str, Any]]], None]:
+    """Write switchboard.json with the given instances."""
+
+    def write(instances: list[dict[str, Any]]) -> None:
+        path = ueserver_dir / "switchboard.json"
+        path.write_text(json.dumps({"instances": instances}), encoding="utf-8")
+
+    return write
+
+
+@pytest.fixture
+def live_pid() -> int:
+    """PID that is guaranteed to be running (this test process)."""
+    return os.getpid()
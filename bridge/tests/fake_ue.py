@@ -0,0 +1,78 @@
+"""Local stand-in for the UE RPC server, for tests without UE5."""
+
+import asyncio
+import json
+from typing import Any
+
+from ue_bridge.tcp_client import close_ue_connections
+from ue_bridge.types import ToolContext
+
+
+class FakeUE:
+    """
+    Ping-only TCP server speaking the UE RPC line protocol.
+
+    keep_alive=False mirrors the UE plugin: reply without a trailing newline,
+    then close. keep_alive=True answers newline-framed replies until EOF.
+    Each reply waits delay seconds; with stagger, delay times the connection
+    number, so replies on later connections arrive later.
+    """
+
+    def __init__(
+        self, *, keep_alive: bool = False, delay: float = 0.0, stagger: bool = False
+    ) -> None:
+        self.keep_alive = keep_alive
+        self.delay = delay
+        self.stagger = stagger
+        self.port = 0
+        self.connections = 0
+        self.frames: list[Any] = []
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> "FakeUE":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await close_ue_connections()
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def ctx(self) -> ToolContext:
+        """Fresh context pointing at this server."""
+        return {"host": "127.0.0.1", "port": self.port, "timeout_ms": 2000}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        delay = self.delay * self.connections if self.stagger else self.delay
+        try:
+            while line := await reader.readline():
+                request = json.loads(line)
+                self.frames.append(request)
+                if delay:
+                    await asyncio.sleep(delay)
+
+                if isinstance(request, list):
+                    reply: Any = [self._reply(item) for item in request]
+                else:
+                    reply = self._reply(request)
+
+                data = json.dumps(reply).encode()
+                writer.write(data + b"\n" if self.keep_alive else data)
+                await writer.drain()
+                if not self.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _reply(request: dict[str, Any]) -> dict[str, Any]:
+        if request.get("op") == "ping":
+            return {"id": request.get("id"), "op": "ping", "ok": True, "version": "0.1.0"}
+        return {"id": request.get("id"), "op": request.get("op"), "ok": False,
+                "error": f"Unknown operation: {request.get('op')}"}
@@ -0,0 +1,171 @@
+"""Tests for the ue-bridge CLI (stdio mode runs as a subprocess)."""
+
+import asyncio
+import json
+import os
+import socketserver
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fake_ue import FakeUE
+
+from ue_bridge import tcp_client
+from ue_bridge.cli import _parse_arg_value, cli_once
+from ue_bridge.types import ToolContext
+
+BRIDGE_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("true", True),
+        ("false", False),
+        ("42", 42),
+        ("-3", -3),
+        ("+5", 5),
+        ("1_000", 1000),
+        (" 7", 7),
+        ("3.14", 3.14),
+        ("+1.5", 1.5),
+        (".5", 0.5),
+        ("1e5", 1e5),
+        ("1_0.5", 10.5),
+        ("1__0", "1__0"),
+        ("0x10", "0x10"),
+        ("inf", "inf"),
+        ("nan", "nan"),
+        ("Cube", "Cube"),
+    ],
+)
+def test_parse_arg_value(raw: str, expected: object) -> None:
+    value = _parse_arg_value(raw)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+async def _run_stdio(
+    stdin: bytes, ue: FakeUE, home: Path, write_switchboard: Callable[..., None]
+) -> tuple[int, list[dict[str, Any]]]:
+    """Run `python -m ue_bridge` in stdio mode and return (exit code, response lines)."""
+    project = home / "proj"
+    project.mkdir(exist_ok=True)
+    write_switchboard(
+        [{"pid": os.getpid(), "port": ue.port, "project": str(project / "P.uproject")}]
+    )
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "ue_bridge",
+        cwd=project,
+        env={**os.environ, "HOME": str(home), "PYTHONPATH": str(BRIDGE_DIR)},
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate(stdin)
+    assert proc.returncode is not None
+    return proc.returncode, [json.loads(line) for line in stdout.splitlines()]
+
+
+class _PingHandler(socketserver.StreamRequestHandler):
+    """Threaded one-shot ping server: blocking I/O would stall an in-loop FakeUE."""
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        self.wfile.write(json.dumps({"id": request["id"], "op": "ping", "ok": True}).encode())
+
+
+def test_cli_once_uses_blocking_socket_without_touching_ctx(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with socketserver.TCPServer(("127.0.0.1", 0), _PingHandler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        ctx: ToolContext = {
+            "host": "127.0.0.1",
+            "port": server.server_address[1],
+            "timeout_ms": 2000,
+        }
+        try:
+            asyncio.run(cli_once(["ue.ping"], ctx))
+        finally:
+            server.shutdown()
+
+    assert set(ctx) == {"host", "port", "timeout_ms"}
+    # Blocking I/O never enters the connection pool
+    assert not tcp_client._idle_connections
+    assert not tcp_client._blocking_io.get()
+    assert json.loads(capsys.readouterr().out)["ok"]
+
+
+def test_stdio_echoes_request_id(
+    ueserver_dir: Path, write_switchboard: Callable[..., None]
+) -> None:
+    async def main() -> tuple[int, list[dict[str, Any]]]:
+        async with FakeUE() as ue:
+            stdin = b"".join(
+                json.dumps({"id": i, "tool": "ue.ping", "args": {}}).encode() + b"\n"
+                for i in range(5)
+            )
+            return await _run_stdio(stdin, ue, ueserver_dir.parent, write_switchboard)
+
+    code, responses = asyncio.run(main())
+    assert code == 0
+    assert sorted(resp["id"] for resp in responses) == list(range(5))
+    assert all(resp["ok"] and resp["tool"] == "ue.ping" for resp in responses)
+
+
+def test_stdio_replies_once_to_each_bad_line(
+    ueserver_dir: Path, write_switchboard: Callable[..., None]
+) -> None:
+    lines = [
+        b"not json",
+        b"[1, 2]",
+        b"42",
+        b'{"id": "a", "tool": ["ue.ping"]}',
+        b'{"id": "b", "tool": "ue.nope"}',
+        b'{"id": "c", "tool": "ue.ping"}',
+    ]
+
+    async def main() -> tuple[int, list[dict[str, Any]]]:
+        async with FakeUE() as ue:
+            stdin = b"\n".join(lines) + b"\n"
+            return await _run_stdio(stdin, ue, ueserver_dir.parent, write_switchboard)
+
+    code, responses = asyncio.run(main())
+    assert code == 0
+    assert len(responses) == len(lines)
+
+    by_id = {resp["id"]: resp for resp in responses if "id" in resp}
+    assert set(by_id) == {"a", "b", "c"}
+    assert not by_id["a"]["ok"]
+    assert by_id["b"]["error"] == "unknown tool: ue.nope"
+    assert by_id["c"]["ok"]
+
+    errors = sorted(resp["error"] for resp in responses if "id" not in resp)
+    assert errors == [
+        "invalid JSON input",
+        "request must be a JSON object",
+        "request must be a JSON object",
+    ]
+
+
+def test_stdio_rejects_over_long_line_once(
+    ueserver_dir: Path, write_switchboard: Callable[..., None]
+) -> None:
+    long_line = b'{"tool": "ue.ping", "pad": "' + b"x" * (3 << 20) + b'"}\n'
+
+    async def main() -> tuple[int, list[dict[str, Any]]]:
+        async with FakeUE() as ue:
+            stdin = long_line + b'{"id": 1, "tool": "ue.ping"}\n'
+            return await _run_stdio(stdin, ue, ueserver_dir.parent, write_switchboard)
+
+    code, responses = asyncio.run(main())
+    assert code == 0
+    assert len(responses) == 2
+    assert responses[0] == {"ok": False, "error": "input line too long"}
+    assert responses[1]["id"] == 1 and responses[1]["ok"]
@@ -0,0 +1,240 @@
+"""Tests for switchboard-based port discovery (temp ~/.ueserver, no UE5)."""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ue_bridge import json_codec, port_discovery
+from ue_bridge.port_discovery import discover_port
+
+
+@pytest.fixture
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count json_codec.loads calls made by port discovery."""
+    calls = [0]
+    loads = json_codec.loads
+
+    def counting_loads(data: bytes | str) -> Any:
+        calls[0] += 1
+        return loads(data)
+
+    monkeypatch.setattr(json_codec, "loads", counting_loads)
+    return calls
+
+
+def test_switchboard_parsed_once_while_unchanged(
+    ueserver_dir: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+    count_parses: list[int],
+) -> None:
+    write_switchboard([{"pid": live_pid, "port": 1111, "project": "/p/P.uproject"}])
+    path = str(ueserver_dir / "switchboard.json")
+
+    first, _, _ = port_discovery._load_switchboard(path)
+    second, _, _ = port_discovery._load_switchboard(path)
+
+    assert first is second
+    assert count_parses[0] == 1
+
+
+def test_switchboard_reparsed_after_change(
+    ueserver_dir: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+) -> None:
+    path = ueserver_dir / "switchboard.json"
+    write_switchboard([{"pid": live_pid, "port": 1111, "project": "/p/P.uproject"}])
+    port_discovery._load_switchboard(str(path))
+
+    # Same size, different content - mtime alone must invalidate
+    write_switchboard([{"pid": live_pid, "port": 2222, "project": "/p/P.uproject"}])
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    data, index, _ = port_discovery._load_switchboard(str(path))
+    assert data["instances"][0]["port"] == 2222
+    assert index["/p"]["port"] == 2222
+
+
+def test_missing_switchboard_reports_not_running() -> None:
+    result = discover_port("/tmp")
+    assert not result["ok"]
+    assert "not running" in result["error"]
+
+
+DEAD_PID = 99_999_999  # Above Linux pid_max, never running
+
+
+def test_project_under_cwd_beats_enclosing_project(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    cwd = tmp_path / "w"
+    write_switchboard([
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "B.uproject")},
+        {"pid": live_pid, "port": 1111, "project": str(cwd / "P" / "P.uproject")},
+    ])
+
+    assert discover_port(str(cwd))["port"] == 1111
+
+
+def test_first_project_under_cwd_in_switchboard_order_wins(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    write_switchboard([
+        {"pid": live_pid, "port": 1111, "project": str(tmp_path / "A" / "A.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "B" / "B.uproject")},
+    ])
+
+    assert discover_port(str(tmp_path))["port"] == 1111
+
+
+def test_project_under_cwd_skips_dead_instances(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    # Sorted path order (A, B, C) differs from switchboard order (C, B, A)
+    write_switchboard([
+        {"pid": DEAD_PID, "port": 3333, "project": str(tmp_path / "C" / "C.uproject")},
+        {"pid": live_pid, "port": 1111, "project": str(tmp_path / "B" / "B.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "A" / "A.uproject")},
+    ])
+
+    assert discover_port(str(tmp_path))["port"] == 1111
+
+
+def test_project_prefix_respects_path_boundary(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    write_switchboard([
+        {"pid": live_pid, "port": 1111, "project": str(tmp_path / "proj2" / "P.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "proj" / "P.uproject")},
+    ])
+
+    assert discover_port(str(tmp_path / "proj"))["port"] == 2222
+
+
+def test_inside_project_uses_nearest_enclosing_root(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    outer = tmp_path / "Outer"
+    inner = outer / "Plugins" / "Inner"
+    write_switchboard([
+        {"pid": live_pid, "port": 1111, "project": str(outer / "Outer.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(inner / "Inner.uproject")},
+    ])
+
+    assert discover_port(str(inner / "Content" / "Maps"))["port"] == 2222
+    assert discover_port(str(outer / "Content"))["port"] == 1111
+
+
+def test_enclosing_walk_stops_at_first_project_root(
+    tmp_path: Path, write_switchboard: Callable[[list[dict[str, Any]]], None], live_pid: int
+) -> None:
+    outer = tmp_path / "Outer"
+    inner = outer / "Plugins" / "Inner"
+    write_switchboard([
+        {"pid": live_pid, "port": 1111, "project": str(outer / "Outer.uproject")},
+        {"pid": DEAD_PID, "port": 2222, "project": str(inner / "Inner.uproject")},
+        {"pid": live_pid, "port": 3333, "project": "/elsewhere/E.uproject"},
+    ])
+
+    result = discover_port(str(inner / "Content"))
+    assert not result["ok"]
+    assert "No matching UE instance" in result["error"]
+
+
+def test_dead_instances_are_removed_from_switchboard(
+    ueserver_dir: Path,
+    tmp_path: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+) -> None:
+    write_switchboard([
+        {"pid": DEAD_PID, "port": 1111, "project": str(tmp_path / "A" / "A.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "B" / "B.uproject")},
+    ])
+
+    assert discover_port(str(tmp_path / "B"))["port"] == 2222
+    data = json_codec.loads((ueserver_dir / "switchboard.json").read_bytes())
+    assert [instance["port"] for instance in data["instances"]] == [2222]
+
+
+def test_bridge_cache_dropped_when_switchboard_changes(
+    ueserver_dir: Path,
+    tmp_path: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cwd = tmp_path / "P"
+    other = {"pid": live_pid, "port": 1111, "project": "/elsewhere/O/O.uproject"}
+    write_switchboard([other])
+
+    # Single-instance fallback picks the other project's editor
+    assert discover_port(str(cwd))["port"] == 1111
+    assert (ueserver_dir / ".bridge_cache").exists()
+
+    # The cwd's own project starts; a new CLI process must see it
+    write_switchboard([other, {"pid": live_pid, "port": 2222, "project": str(cwd / "P.uproject")}])
+    monkeypatch.setattr(port_discovery, "_discovery_memo", None)
+    monkeypatch.setattr(port_discovery, "_switchboard_cache", None)
+    assert discover_port(str(cwd))["port"] == 2222
+
+
+def test_discovery_memo_skips_filesystem_until_invalidated(
+    ueserver_dir: Path,
+    tmp_path: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+) -> None:
+    project = str(tmp_path / "P")
+    write_switchboard([{"pid": live_pid, "port": 1111, "project": f"{project}/P.uproject"}])
+    assert discover_port(project)["port"] == 1111
+
+    # Neither the switchboard nor the file cache is consulted within the TTL
+    (ueserver_dir / "switchboard.json").unlink()
+    (ueserver_dir / ".bridge_cache").unlink()
+    assert discover_port(project)["port"] == 1111
+
+    port_discovery.invalidate_port_cache()
+    assert not discover_port(project)["ok"]
+
+
+def test_discovery_memo_is_per_project_and_expires(
+    tmp_path: Path,
+    write_switchboard: Callable[[list[dict[str, Any]]], None],
+    live_pid: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    write_switchboard([
+        {"pid": live_pid, "port": 1111, "project": str(tmp_path / "A" / "A.uproject")},
+        {"pid": live_pid, "port": 2222, "project": str(tmp_path / "B" / "B.uproject")},
+    ])
+    assert discover_port(str(tmp_path / "A"))["port"] == 1111
+    assert discover_port(str(tmp_path / "B"))["port"] == 2222
+
+    memo = port_discovery._discovery_memo
+    assert memo is not None
+    monkeypatch.setattr(
+        port_discovery, "_discovery_memo", (memo[0] - port_discovery._DISCOVERY_TTL, *memo[1:])
+    )
+    write_switchboard([])
+    (tmp_path / ".ueserver" / ".bridge_cache").unlink()
+    assert not discover_port(str(tmp_path / "B"))["ok"]
+
+
+@pytest.mark.parametrize(
+    ("error", "running"),
+    [(PermissionError(1, "EPERM"), True), (ProcessLookupError(3, "ESRCH"), False)],
+)
+def test_pid_liveness_from_kill_errors(
+    monkeypatch: pytest.MonkeyPatch, error: OSError, running: bool
+) -> None:
+    def fake_kill(pid: int, sig: int) -> None:
+        raise error
+
+    monkeypatch.setattr(os, "kill", fake_kill)
+    assert port_discovery._is_process_running(4242) is running
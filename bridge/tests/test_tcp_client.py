@@ -0,0 +1,178 @@
+"""Tests for tcp_client against a local fake UE server."""
+
+import asyncio
+import socket
+from pathlib import Path
+
+import pytest
+from fake_ue import FakeUE
+
+from ue_bridge import port_discovery, tcp_client
+from ue_bridge.tcp_client import (
+    call_ue,
+    call_ue_batch,
+    close_ue_client,
+    close_ue_connections,
+    create_ue_client,
+    gather_ue,
+)
+from ue_bridge.types import ToolContext
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+@pytest.mark.parametrize("keep_alive", [False, True])
+def test_concurrent_calls_on_one_ctx(keep_alive: bool) -> None:
+    async def main() -> None:
+        async with FakeUE(keep_alive=keep_alive, delay=0.01, stagger=True) as ue:
+            ctx = ue.ctx
+            # Warm up so a connection from an earlier call is available for reuse
+            await call_ue("ping", {}, ctx)
+            responses = await asyncio.gather(*[call_ue("ping", {}, ctx) for _ in range(5)])
+
+            assert all(resp["ok"] for resp in responses)
+            assert len({resp["id"] for resp in responses}) == 5
+
+            await close_ue_client(ctx)
+            assert not any(tcp_client._idle_connections.values())
+
+    asyncio.run(main())
+
+
+def test_keep_alive_connection_is_reused() -> None:
+    async def main() -> None:
+        async with FakeUE(keep_alive=True) as ue:
+            ctx = ue.ctx
+            for _ in range(3):
+                assert (await call_ue("ping", {}, ctx))["ok"]
+            assert ue.connections == 1
+
+    asyncio.run(main())
+
+
+def test_server_closing_after_each_reply_reconnects() -> None:
+    async def main() -> None:
+        async with FakeUE(keep_alive=False) as ue:
+            ctx = ue.ctx
+            for _ in range(3):
+                assert (await call_ue("ping", {}, ctx))["ok"]
+            assert ue.connections == 3
+            # Closed connections are not kept in the pool
+            assert not any(tcp_client._idle_connections.values())
+
+    asyncio.run(main())
+
+
+def test_connection_error_invalidates_port_cache(
+    ueserver_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ueserver_dir / ".bridge_cache"
+    cache.write_text("/tmp\n1\n1\nx\n0\n0\n", encoding="utf-8")
+    monkeypatch.setattr(port_discovery, "_discovery_memo", (0.0, "/tmp", {"ok": True}))
+    ctx: ToolContext = {"host": "127.0.0.1", "port": _unused_port(), "timeout_ms": 500}
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(call_ue("ping", {}, ctx))
+    assert not cache.exists()
+    assert port_discovery._discovery_memo is None
+
+
+def test_gather_ue_sends_one_batch_frame() -> None:
+    async def main() -> None:
+        async with FakeUE() as ue:
+            ctx = ue.ctx
+            responses = await gather_ue(*[call_ue("ping", {}, ctx) for _ in range(3)])
+
+            assert [resp["ok"] for resp in responses] == [True, True, True]
+            assert len(ue.frames) == 1
+            frame = ue.frames[0]
+            assert isinstance(frame, list)
+            assert [item["id"] for item in frame] == [resp["id"] for resp in responses]
+
+    asyncio.run(main())
+
+
+def test_gather_ue_batches_mixed_timeouts() -> None:
+    """ue_ping (500 ms) and ue_health (ctx timeout) share one round trip."""
+
+    async def main() -> None:
+        async with FakeUE(delay=0.2) as ue:
+            ctx = ue.ctx
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            responses = await gather_ue(
+                call_ue("ping", {}, ctx, timeout_ms=500), call_ue("ping", {}, ctx)
+            )
+            elapsed = loop.time() - started
+
+            assert [resp["ok"] for resp in responses] == [True, True]
+            assert len(ue.frames) == 1
+            assert elapsed < 0.35
+
+    asyncio.run(main())
+
+
+def test_gather_ue_flushes_servers_concurrently() -> None:
+    async def main() -> None:
+        async with FakeUE(delay=0.2) as first, FakeUE(delay=0.2) as second:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            responses = await gather_ue(
+                call_ue("ping", {}, first.ctx), call_ue("ping", {}, second.ctx)
+            )
+            elapsed = loop.time() - started
+
+            assert [resp["ok"] for resp in responses] == [True, True]
+            assert elapsed < 0.35
+
+    asyncio.run(main())
+
+
+def test_gather_ue_batch_uses_smallest_timeout() -> None:
+    async def main() -> None:
+        async with FakeUE(delay=0.3) as ue:
+            ctx = ue.ctx
+            with pytest.raises(TimeoutError):
+                await gather_ue(call_ue("ping", {}, ctx, timeout_ms=100), call_ue("ping", {}, ctx))
+
+    asyncio.run(main())
+
+
+def test_call_ue_batch_keeps_results_in_request_order() -> None:
+    async def main() -> None:
+        async with FakeUE() as ue:
+            responses = await call_ue_batch([("ping", {}), ("bogus", {})], ue.ctx)
+            assert [resp["op"] for resp in responses] == ["ping", "bogus"]
+            assert [resp["ok"] for resp in responses] == [True, False]
+
+    asyncio.run(main())
+
+
+def test_call_ue_batch_honours_zero_timeout() -> None:
+    async def main() -> None:
+        async with FakeUE(delay=0.5) as ue:
+            with pytest.raises(TimeoutError):
+                await call_ue_batch([("ping", {}), ("ping", {})], ue.ctx, timeout_ms=0)
+
+    asyncio.run(main())
+
+
+def test_fresh_contexts_share_pooled_connection() -> None:
+    """Callers that build a new ctx per call (the MCP server) still reuse connections."""
+
+    async def main() -> None:
+        async with FakeUE(keep_alive=True) as ue:
+            for _ in range(3):
+                client = create_ue_client(port=ue.port, host="127.0.0.1", timeout_ms=2000)
+                assert (await call_ue("ping", {}, client["context"]))["ok"]
+            assert ue.connections == 1
+
+            await close_ue_connections()
+            assert not tcp_client._idle_connections
+
+    asyncio.run(main())
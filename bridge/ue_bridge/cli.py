@@ -1,14 +1,38 @@
 """CLI interface for UE Bridge - stdio and command-line modes."""
 
-import asyncio
-import json
+import re
 import sys
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 from .port_discovery import discover_port
 from .tools import TOOL_HANDLERS, TOOL_NAMES
 from .types import ToolContext, UEResponse
 
+# asyncio, tcp_client and json_codec (orjson) are imported where used -
+# `ue-bridge --help` never needs them and they dominate cold start time.
+if TYPE_CHECKING:
+    import asyncio
+
+# Max stdio requests in flight at once
+STDIO_CONCURRENCY = 10
+
+# Max length of one stdio request line (bytes)
+STDIO_LINE_LIMIT = 1 << 20
+
+# Set while a stdout flush is queued on the event loop
+_flush_scheduled = False
+
+# CLI value classification (see _parse_arg_value)
+_LITERAL_VALUES: dict[str, Any] = {"true": True, "false": False}
+# Same literals int()/float() accept (sign, "_" between digits, surrounding
+# whitespace), except inf/nan, which have no JSON representation
+_DIGITS = r"\d(?:_?\d)*"
+_INT_RE = re.compile(rf"\s*[-+]?{_DIGITS}\s*")
+_FLOAT_RE = re.compile(
+    rf"\s*[-+]?(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})(?:[eE][-+]?{_DIGITS})?\s*"
+)
+
 
 def _is_ok(resp: UEResponse) -> bool:
     """Check if response indicates success."""
@@ -38,8 +62,9 @@ async def invoke_tool(
             "available_tools": TOOL_NAMES,
         }
 
-    handler = TOOL_HANDLERS.get(tool_name)
-    if not handler:
+    try:
+        handler = TOOL_HANDLERS[tool_name]
+    except KeyError:
         return {
             "tool": tool_name,
             "ok": False,
@@ -64,41 +89,130 @@ async def invoke_tool(
         }
 
 
-async def stdio_loop(ctx: ToolContext) -> None:
+async def stdio_loop(ctx: ToolContext, concurrency: int = STDIO_CONCURRENCY) -> None:
     """
     Read JSON-RPC requests from stdin, write responses to stdout.
 
+    Up to `concurrency` requests are in flight at once. Responses are written
+    in completion order; include an "id" in the request to correlate them.
+
     Format:
-        Input: {"tool": "ue.ping", "args": {}}
-        Output: {"tool": "ue.ping", "ok": true, "response": {...}}
+        Input: {"id": 1, "tool": "ue.ping", "args": {}}
+        Output: {"id": 1, "tool": "ue.ping", "ok": true, "response": {...}}
     """
-    buffer = ""
+    import asyncio
 
-    for line in sys.stdin:
-        buffer += line
+    from . import json_codec
+    from .tcp_client import close_ue_client
 
-        # Process complete lines
-        while "\n" in buffer:
-            line_text, buffer = buffer.split("\n", 1)
-            line_text = line_text.strip()
+    # tcp_client gives each in-flight request its own pooled connection
+    slots = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task[None]] = set()
 
-            if not line_text:
+    try:
+        async for line in _stdin_lines():
+            line = line.strip()
+            if not line:
                 continue
 
             # Parse JSON
             try:
-                invocation = json.loads(line_text)
-            except json.JSONDecodeError:
-                _write_response({"ok": False, "error": "invalid JSON input"})
+                invocation = json_codec.loads(line)
+            except ValueError:
+                _write_stdio_response({"ok": False, "error": "invalid JSON input"})
+                continue
+
+            if not isinstance(invocation, dict):
+                _write_stdio_response({"ok": False, "error": "request must be a JSON object"})
                 continue
 
             # Invoke tool
+            await slots.acquire()
+            task = asyncio.create_task(_run_invocation(invocation, ctx, slots))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        sys.stdout.buffer.flush()
+        await close_ue_client(ctx)
+
+
+async def _stdin_lines() -> AsyncIterator[bytes]:
+    """
+    Yield stdin lines without blocking the event loop.
+
+    Pipes and sockets are read through an asyncio StreamReader. Regular files
+    (ue-bridge < requests.jsonl) and Windows consoles fall back to a thread.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=STDIO_LINE_LIMIT)
+
+    try:
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer
+        )
+    except (NotImplementedError, ValueError, OSError):
+        while line := await asyncio.to_thread(sys.stdin.buffer.readline):
+            yield line
+        return
+
+    while True:
+        try:
+            line = await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as err:
+            # EOF - yield a final line that has no trailing newline
+            if err.partial:
+                yield err.partial
+            return
+        except asyncio.LimitOverrunError as err:
+            # Line exceeds STDIO_LINE_LIMIT - one error reply for the whole line
+            await _discard_line(reader, err.consumed)
+            _write_stdio_response({"ok": False, "error": "input line too long"})
+            continue
+        yield line
+
+
+async def _discard_line(reader: "asyncio.StreamReader", consumed: int) -> None:
+    """Drop the rest of an over-long line, up to and including its newline."""
+    import asyncio
+
+    try:
+        while True:
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b"\n")
+                return
+            except asyncio.LimitOverrunError as err:
+                consumed = err.consumed
+    except asyncio.IncompleteReadError:
+        return  # EOF inside the line
+
+
+async def _run_invocation(
+    invocation: dict[str, Any],
+    ctx: ToolContext,
+    slots: "asyncio.Semaphore",
+) -> None:
+    """Invoke one stdio request, write exactly one response, release its slot."""
+    try:
+        try:
             result = await invoke_tool(
                 invocation.get("tool"),
                 invocation.get("args", {}),
                 ctx,
             )
-            _write_response(result)
+        except Exception as err:
+            # invoke_tool handles tool errors; this catches malformed requests
+            result = {"tool": invocation.get("tool"), "ok": False, "error": str(err)}
+        if "id" in invocation:
+            result = {"id": invocation["id"], **result}
+        _write_stdio_response(result)
+    finally:
+        slots.release()
 
 
 async def cli_once(args: list[str], ctx: ToolContext) -> None:
@@ -112,10 +226,14 @@ async def cli_once(args: list[str], ctx: ToolContext) -> None:
         _write_response({"ok": False, "error": "no tool specified"})
         return
 
+    from .tcp_client import blocking_requests
+
     tool_name = args[0]
     parsed_args = _parse_cli_args(args[1:])
 
-    result = await invoke_tool(tool_name, parsed_args, ctx)
+    # Single request - skip asyncio transport setup in call_ue
+    with blocking_requests():
+        result = await invoke_tool(tool_name, parsed_args, ctx)
     _write_response(result)
 
 
@@ -147,33 +265,67 @@ def _parse_arg_value(val: str) -> Any:
         "true" → True
         "false" → False
         "42" → 42
+        "+5" → 5
+        "1_000" → 1000
         "3.14" → 3.14
         "hello" → "hello"
+        "inf", "nan" → kept as strings (not valid JSON numbers)
     """
-    if val == "true":
-        return True
-    if val == "false":
-        return False
+    if val in _LITERAL_VALUES:
+        return _LITERAL_VALUES[val]
 
-    # Try int
-    try:
+    if _INT_RE.fullmatch(val):
         return int(val)
-    except ValueError:
-        pass
 
-    # Try float
-    try:
+    if _FLOAT_RE.fullmatch(val):
         return float(val)
-    except ValueError:
-        pass
 
     # String
     return val
 
 
 def _write_response(obj: dict[str, Any]) -> None:
-    """Write JSON response to stdout."""
-    print(json.dumps(obj), flush=True)
+    """Write JSON response line to stdout as bytes (skips the text codec)."""
+    from . import json_codec
+
+    sys.stdout.buffer.write(json_codec.dumps(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _write_error(message: str) -> None:
+    """Write compact JSON error line to stderr."""
+    from . import json_codec
+
+    sys.stderr.buffer.write(json_codec.dumps({"ok": False, "error": message}) + b"\n")
+    sys.stderr.buffer.flush()
+
+
+def _write_stdio_response(obj: dict[str, Any]) -> None:
+    """
+    Write JSON response line in stdio mode.
+
+    The flush is deferred to the end of the current event loop tick, so
+    responses completing together are flushed with one syscall.
+    """
+    global _flush_scheduled
+
+    from . import json_codec
+
+    sys.stdout.buffer.write(json_codec.dumps(obj) + b"\n")
+
+    if not _flush_scheduled:
+        import asyncio
+
+        _flush_scheduled = True
+        asyncio.get_running_loop().call_soon(_flush_stdout)
+
+
+def _flush_stdout() -> None:
+    """Flush stdout (scheduled by _write_stdio_response)."""
+    global _flush_scheduled
+
+    _flush_scheduled = False
+    sys.stdout.buffer.flush()
 
 
 def _print_help() -> None:
@@ -214,16 +366,12 @@ def create_context(timeout_ms: int = 2000) -> ToolContext:
 
     if not discovery.get("ok"):
         error_msg = discovery.get("error", "Unknown port discovery error")
-        print(json.dumps({"ok": False, "error": error_msg}), file=sys.stderr, flush=True)
+        _write_error(error_msg)
         sys.exit(1)
 
     port = discovery.get("port")
     if port is None:
-        print(
-            json.dumps({"ok": False, "error": "Port discovery succeeded but no port returned"}),
-            file=sys.stderr,
-            flush=True,
-        )
+        _write_error("Port discovery succeeded but no port returned")
         sys.exit(1)
 
     context: ToolContext = {
@@ -237,12 +385,12 @@ def create_context(timeout_ms: int = 2000) -> ToolContext:
 
 async def async_main() -> None:
     """Async main entry point."""
+    if _wants_help():
+        _print_help()
+        return
+
     if len(sys.argv) > 1:
         # CLI mode: ue-bridge ue.ping
-        if sys.argv[1] in ("-h", "--help", "help"):
-            _print_help()
-            return
-
         # Parse timeout from args
         timeout_ms = 2000
         args = sys.argv[1:]
@@ -253,11 +401,7 @@ async def async_main() -> None:
                 try:
                     timeout_ms = int(arg.split("=", 1)[1])
                 except (ValueError, IndexError):
-                    print(
-                        json.dumps({"ok": False, "error": "Invalid --timeout value"}),
-                        file=sys.stderr,
-                        flush=True,
-                    )
+                    _write_error("Invalid --timeout value")
                     sys.exit(1)
             else:
                 filtered_args.append(arg)
@@ -266,24 +410,33 @@ async def async_main() -> None:
         ctx = create_context(timeout_ms=timeout_ms)
         await cli_once(filtered_args, ctx)
     else:
-        # If running in a TTY with no args, show help.
-        if sys.stdin.isatty():
-            _print_help()
-            return
-
         # Stdio mode: echo '{"tool":"ue.ping"}' | ue-bridge
         ctx = create_context()
         await stdio_loop(ctx)
 
 
+def _wants_help() -> bool:
+    """Check for explicit help flag, or no args in an interactive TTY."""
+    if len(sys.argv) > 1:
+        return sys.argv[1] in ("-h", "--help", "help")
+    return sys.stdin.isatty()
+
+
 def main() -> None:
     """Main entry point."""
     try:
+        # Answer help before importing asyncio
+        if _wants_help():
+            _print_help()
+            return
+
+        import asyncio
+
         asyncio.run(async_main())
     except KeyboardInterrupt:
         pass
     except Exception as err:
-        print(json.dumps({"ok": False, "error": str(err)}), flush=True, file=sys.stderr)
+        _write_error(str(err))
         sys.exit(1)
 
 
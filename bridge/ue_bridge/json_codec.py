@@ -0,0 +1,33 @@
+"""JSON encode/decode on bytes - uses orjson when installed, stdlib json otherwise."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON document from UTF-8 bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps_str(obj: Any) -> str:
+        """Serialize obj to compact JSON str (for APIs that require text)."""
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON document from UTF-8 bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return dumps_str(obj).encode("utf-8")
+
+    def dumps_str(obj: Any) -> str:
+        """Serialize obj to compact JSON str (for APIs that require text)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -1,12 +1,38 @@
 """Port discovery for UE RPC server via ~/.ueserver/switchboard.json"""
 
+import bisect
 import json
 import os
-from pathlib import Path
+import time
 from typing import Any
 
 from .types import PortDiscoveryResult
 
+# Resolved once at import; $HOME does not change during a bridge session
+_UESERVER_DIR = os.path.join(os.path.expanduser("~"), ".ueserver")
+_SWITCHBOARD_PATH = os.path.join(_UESERVER_DIR, "switchboard.json")
+
+# Last successful discovery, reused by one-shot CLI invocations
+_CACHE_PATH = os.path.join(_UESERVER_DIR, ".bridge_cache")
+
+# In-process memo for long-running callers (MCP server, stdio): the last
+# successful (monotonic seconds, project_dir, result), reused for _DISCOVERY_TTL
+_discovery_memo: tuple[float, str, PortDiscoveryResult] | None = None
+_DISCOVERY_TTL = 5.0
+
+# (normalized project file path, switchboard position, instance), sorted by path
+_ProjectPaths = list[tuple[str, int, dict[str, Any]]]
+
+# ((st_mtime_ns, st_size), parsed data, project root index, sorted project paths)
+# of the last switchboard read
+_switchboard_cache: (
+    tuple[tuple[int, int], dict[str, Any], dict[str, dict[str, Any]], _ProjectPaths] | None
+) = None
+
+# pid -> (checked_at monotonic seconds, running)
+_pid_check_cache: dict[int, tuple[float, bool]] = {}
+_PID_CHECK_TTL = 1.0
+
 
 def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
     """
@@ -30,15 +56,116 @@ def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
                 }
             ]
         }
+
+    Successful results are cached in ~/.ueserver/.bridge_cache. The cache is
+    used while switchboard.json is unchanged (mtime and size) and its PID is
+    alive, and is removed by call_ue on connection errors.
+    Within one process, a successful result is reused for _DISCOVERY_TTL
+    seconds without touching the filesystem.
     """
+    global _discovery_memo
+
     if project_dir is None:
         project_dir = os.getcwd()
 
-    # Switchboard file is in ~/.ueserver/
-    switchboard_path = Path.home() / ".ueserver" / "switchboard.json"
+    now = time.monotonic()
+    memo = _discovery_memo
+    if memo is not None and memo[1] == project_dir and now - memo[0] < _DISCOVERY_TTL:
+        return memo[2].copy()
+
+    result = _load_cached_port(project_dir)
+    if result is None:
+        result = _discover_from_switchboard(project_dir)
+        # Key the cache by the switchboard version the result was matched
+        # against; a cleanup write makes it stale, which only costs a re-parse
+        if result.get("ok") and _switchboard_cache is not None:
+            _save_cached_port(project_dir, result, _switchboard_cache[0])
+
+    if result.get("ok"):
+        _discovery_memo = (now, project_dir, result.copy())
+
+    return result
+
+
+def invalidate_port_cache() -> None:
+    """Drop cached ports so the next discovery re-reads the switchboard."""
+    global _discovery_memo
+    _discovery_memo = None
+
+    try:
+        os.unlink(_CACHE_PATH)
+    except OSError:
+        pass  # Missing cache is the desired state
+
+
+def _load_cached_port(project_dir: str) -> PortDiscoveryResult | None:
+    """
+    Load last discovered port for project_dir from the bridge cache.
+
+    Cache file format (one value per line):
+        project_dir
+        port
+        pid
+        started
+        switchboard st_mtime_ns
+        switchboard st_size
+
+    Returns:
+        PortDiscoveryResult if cache matches project_dir and the current
+        switchboard, and PID is alive, else None
+    """
+    try:
+        with open(_CACHE_PATH, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        cached_dir, port_str, pid_str, started, mtime_str, size_str = lines[:6]
+        port = int(port_str)
+        pid = int(pid_str)
+        switchboard_key = (int(mtime_str), int(size_str))
+    except (OSError, ValueError):
+        return None
+
+    if cached_dir != project_dir:
+        return None
+
+    # Any switchboard change (new instance, removal) may change the match
+    try:
+        st = os.stat(_SWITCHBOARD_PATH)
+    except OSError:
+        return None
+    if (st.st_mtime_ns, st.st_size) != switchboard_key or not _is_process_running(pid):
+        return None
 
-    # Check if file exists
-    if not switchboard_path.exists():
+    return {
+        "ok": True,
+        "port": port,
+        "pid": pid,
+        "started": started,
+    }
+
+
+def _save_cached_port(
+    project_dir: str, result: PortDiscoveryResult, switchboard_key: tuple[int, int]
+) -> None:
+    """Write successful discovery result to the bridge cache (best-effort)."""
+    mtime_ns, size = switchboard_key
+    try:
+        with open(_CACHE_PATH, "w", encoding="utf-8") as f:
+            f.write(
+                f"{project_dir}\n{result['port']}\n{result['pid']}\n"
+                f"{result.get('started', '')}\n{mtime_ns}\n{size}\n"
+            )
+    except OSError:
+        pass  # Caching is best-effort, discovery already succeeded
+
+
+def _discover_from_switchboard(project_dir: str) -> PortDiscoveryResult:
+    """Discover port by parsing ~/.ueserver/switchboard.json (cache miss path)."""
+    switchboard_path = _SWITCHBOARD_PATH
+
+    # Read and parse JSON (cached while the file is unchanged)
+    try:
+        data, project_index, project_paths = _load_switchboard(switchboard_path)
+    except FileNotFoundError:
         return {
             "ok": False,
             "error": (
@@ -46,12 +173,7 @@ def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
                 "Start UE5 with UEServer plugin enabled."
             ),
         }
-
-    # Read and parse JSON
-    try:
-        with open(switchboard_path, "r", encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-    except json.JSONDecodeError as err:
+    except ValueError as err:
         return {
             "ok": False,
             "error": f"Invalid JSON in {switchboard_path}: {err}",
@@ -86,9 +208,9 @@ def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
     # If we removed any dead instances, write back cleaned switchboard
     if len(alive_instances) < len(instances):
         try:
-            data["instances"] = alive_instances
+            # New dict - the parsed data may be shared with _switchboard_cache
             with open(switchboard_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+                json.dump({**data, "instances": alive_instances}, f, indent=2)
         except OSError:
             pass  # Cleanup is best-effort, continue even if write fails
 
@@ -100,60 +222,62 @@ def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
             "error": "No UE instances running in switchboard",
         }
 
-    # Find instance for current project directory
-    project_dir_path = Path(project_dir).resolve()
+    # Find instance for current project directory - lookups in the cached
+    # path structures, no normalization or filesystem access per instance.
+    project_dir_norm = os.path.normpath(os.path.abspath(project_dir))
 
-    for instance in instances:
-        # Check if this instance matches our project
-        instance_project = instance.get("project", "")
-        if instance_project:
-            instance_project_path = Path(instance_project).resolve()
-            # Match if the project file is in our project directory
-            if str(instance_project_path).startswith(str(project_dir_path)):
-                port = instance.get("port")
-                pid = instance.get("pid")
-                started = instance.get("started", "")
-
-                # Validate required fields
-                if port is None:
-                    return {
-                        "ok": False,
-                        "error": "Instance missing 'port' field",
-                    }
-                if pid is None:
-                    return {
-                        "ok": False,
-                        "error": "Instance missing 'pid' field",
-                    }
-
-                # Validate types
-                if not isinstance(port, int):
-                    return {
-                        "ok": False,
-                        "error": f"Invalid port type: expected int, got {type(port).__name__}",
-                    }
-                if not isinstance(pid, int):
-                    return {
-                        "ok": False,
-                        "error": f"Invalid pid type: expected int, got {type(pid).__name__}",
-                    }
-
-                # Validate PID
-                if not _is_process_running(pid):
-                    return {
-                        "ok": False,
-                        "error": (
-                            f"Stale instance detected: process {pid} is not running. "
-                            f"Restart UE5 or clean {switchboard_path}."
-                        ),
-                    }
-
-                return {
-                    "ok": True,
-                    "port": port,
-                    "pid": pid,
-                    "started": started,
-                }
+    # Project file at or below project_dir - first in switchboard order wins
+    match = _find_instance_under(os.path.join(project_dir_norm, ""), project_paths)
+
+    if match is None:
+        # Run from inside a project (e.g. Content/): nearest enclosing project root
+        match = _find_instance_by_root(project_dir_norm, project_index)
+
+    if match is not None:
+        port = match.get("port")
+        pid = match.get("pid")
+        started = match.get("started", "")
+
+        # Validate required fields
+        if port is None:
+            return {
+                "ok": False,
+                "error": "Instance missing 'port' field",
+            }
+        if pid is None:
+            return {
+                "ok": False,
+                "error": "Instance missing 'pid' field",
+            }
+
+        # Validate types
+        if not isinstance(port, int):
+            return {
+                "ok": False,
+                "error": f"Invalid port type: expected int, got {type(port).__name__}",
+            }
+        if not isinstance(pid, int):
+            return {
+                "ok": False,
+                "error": f"Invalid pid type: expected int, got {type(pid).__name__}",
+            }
+
+        # Validate PID
+        if not _is_process_running(pid):
+            return {
+                "ok": False,
+                "error": (
+                    f"Stale instance detected: process {pid} is not running. "
+                    f"Restart UE5 or clean {switchboard_path}."
+                ),
+            }
+
+        return {
+            "ok": True,
+            "port": port,
+            "pid": pid,
+            "started": started,
+        }
 
     # If only one instance, use it (fallback for convenience)
     if len(instances) == 1:
@@ -179,6 +303,132 @@ def discover_port(project_dir: str | None = None) -> PortDiscoveryResult:
     }
 
 
+def _load_switchboard(
+    path: str,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]], _ProjectPaths]:
+    """
+    Read and parse switchboard.json, reusing the last parse if unchanged.
+
+    The file is considered unchanged while (st_mtime_ns, st_size) match.
+
+    Returns:
+        (parsed data, index of instances by normalized project root directory,
+        normalized project file paths sorted for prefix search)
+
+    Raises:
+        FileNotFoundError: If the switchboard does not exist
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    global _switchboard_cache
+
+    # Imported on first parse: orjson is not needed for --help or a cache hit
+    from . import json_codec
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        _switchboard_cache = None
+        raise
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _switchboard_cache is not None and _switchboard_cache[0] == key:
+        return _switchboard_cache[1], _switchboard_cache[2], _switchboard_cache[3]
+
+    data: dict[str, Any] = json_codec.loads(_read_bytes(path, st.st_size))
+
+    index: dict[str, dict[str, Any]] = {}
+    paths: _ProjectPaths = []
+    instances = data.get("instances") if isinstance(data, dict) else None
+    if isinstance(instances, list):
+        for position, instance in enumerate(instances):
+            project = instance.get("project") if isinstance(instance, dict) else None
+            if isinstance(project, str) and project:
+                project_norm = os.path.normpath(project)
+                paths.append((project_norm, position, instance))
+                # First entry wins, matching switchboard order
+                index.setdefault(os.path.dirname(project_norm), instance)
+    paths.sort(key=lambda entry: entry[:2])
+
+    _switchboard_cache = (key, data, index, paths)
+    return data, index, paths
+
+
+def _read_bytes(path: str, size_hint: int) -> bytes:
+    """
+    Read whole file as bytes, normally with a single os.read().
+
+    Skips the buffered/text file object layers; size_hint is the stat() size.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buf = os.read(fd, size_hint + 1)
+        if len(buf) <= size_hint:
+            return buf
+
+        # File grew since stat() - read the rest
+        chunks = [buf]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _find_instance_under(prefix: str, paths: _ProjectPaths) -> dict[str, Any] | None:
+    """
+    Return the running instance with a project file below prefix.
+
+    Matching paths are adjacent in the sorted list, so only those are
+    visited; among them the earliest in switchboard order wins.
+
+    Args:
+        prefix: Normalized absolute directory ending in os.sep
+        paths: Sorted project paths (from _load_switchboard)
+    """
+    best: tuple[int, dict[str, Any]] | None = None
+    start = bisect.bisect_left(paths, prefix, key=lambda entry: entry[0])
+    for i in range(start, len(paths)):
+        project_norm, position, instance = paths[i]
+        if not project_norm.startswith(prefix):
+            break
+        if best is not None and best[0] < position:
+            continue
+        pid = instance.get("pid")
+        if isinstance(pid, int) and _is_process_running(pid):
+            best = (position, instance)
+
+    return best[1] if best is not None else None
+
+
+def _find_instance_by_root(
+    project_dir: str, index: dict[str, dict[str, Any]]
+) -> dict[str, Any] | None:
+    """
+    Walk from project_dir towards / and return the nearest indexed instance.
+
+    The walk stops at the first indexed project root: if that instance is
+    not running, no outer project is tried instead.
+
+    Args:
+        project_dir: Normalized absolute directory
+        index: Instances by project root (from _load_switchboard)
+    """
+    path = project_dir
+    while True:
+        instance = index.get(path)
+        if instance is not None:
+            pid = instance.get("pid")
+            if isinstance(pid, int) and _is_process_running(pid):
+                return instance
+            return None
+
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
 def _is_process_running(pid: int) -> bool:
     """
     Check if a process with given PID is running.
@@ -188,10 +438,24 @@ def _is_process_running(pid: int) -> bool:
 
     Returns:
         True if process is running, False otherwise
+
+    Results are reused for _PID_CHECK_TTL seconds to avoid repeated syscalls
+    for the same PID (cleanup pass, match validation, reconnect retries).
     """
+    now = time.monotonic()
+    cached = _pid_check_cache.get(pid)
+    if cached is not None and now - cached[0] < _PID_CHECK_TTL:
+        return cached[1]
+
     try:
         # Send signal 0 to check if process exists (doesn't actually send a signal)
         os.kill(pid, 0)
-        return True
+        running = True
+    except PermissionError:
+        # Exists, but owned by another user
+        running = True
     except OSError:
-        return False
+        running = False
+
+    _pid_check_cache[pid] = (now, running)
+    return running
@@ -1,13 +1,38 @@
 """TCP RPC client for UE server communication."""
 
 import asyncio
-import json
+import itertools
+import os
 import socket
-import uuid
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, cast
 
+from . import json_codec
+from .port_discovery import invalidate_port_cache
 from .types import ToolContext, UEResponse
 
+# Request IDs: cli-<pid>-<counter> (hex)
+_REQUEST_ID_PREFIX = f"cli-{os.getpid():x}-"
+_request_counter = itertools.count(1)
+
+# Largest response frame accepted (also the StreamReader buffer limit)
+_MAX_RESPONSE_BYTES = 1 << 20
+
+# Idle keep-alive connections by (event loop, host, port). A connection is
+# checked out for exactly one request at a time, so concurrent call_ue() calls
+# (also on the same ctx) never share a stream.
+_Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_idle_connections: dict[tuple[asyncio.AbstractEventLoop, str, int], list[_Connection]] = {}
+_MAX_IDLE_PER_SERVER = 8
+
+# Set while gather_ue() creates its tasks; call_ue() routes requests through it
+_active_batcher: ContextVar["_RequestBatcher | None"] = ContextVar("_active_batcher", default=None)
+
+# Set inside blocking_requests(); call_ue() then uses a plain blocking socket
+_blocking_io: ContextVar[bool] = ContextVar("_blocking_io", default=False)
+
 
 def create_ue_client(
     port: int | None = None,
@@ -43,14 +68,20 @@ async def call_ue(
     op: str,
     params: dict[str, Any],
     ctx: ToolContext,
+    *,
+    timeout_ms: int | None = None,
 ) -> UEResponse:
     """
     Call UE RPC server over TCP.
 
+    Connections are pooled per server and reused while the server keeps them
+    open. Call close_ue_client(ctx) (or close_ue_connections()) when done.
+
     Args:
         op: Operation name (e.g., 'ping')
         params: Operation parameters
         ctx: Tool context with host, port, timeout
+        timeout_ms: Override ctx["timeout_ms"] for this call only
 
     Returns:
         Response dictionary from UE server
@@ -58,12 +89,28 @@ async def call_ue(
     Raises:
         asyncio.TimeoutError: If request times out
         ConnectionError: If TCP connection fails
-        ValueError: If server returns invalid JSON
+        ValueError: If server returns invalid JSON, no frame, or a frame over 1 MiB
 
     Protocol:
         Request:  {"id": "req-001", "op": "ping", ...params}
         Response: {"id": "req-001", "op": "ping", "ok": true, ...fields}
+
+    Inside gather_ue(), the request is queued and sent as part of a batch.
     """
+    if timeout_ms is None:
+        timeout_ms = ctx["timeout_ms"]
+
+    batcher = _active_batcher.get()
+    if batcher is not None:
+        return await batcher.submit(op, params, ctx, timeout_ms)
+
+    return await _call_ue_now(op, params, ctx, timeout_ms)
+
+
+async def _call_ue_now(
+    op: str, params: dict[str, Any], ctx: ToolContext, timeout_ms: int
+) -> UEResponse:
+    """Send single request immediately (bypasses gather_ue batching)."""
     request_id = ctx.get("request_id") or _generate_request_id()
 
     # Build payload
@@ -73,57 +120,395 @@ async def call_ue(
         **params,
     }
 
-    # Convert to JSON and add newline (line-based protocol)
-    request_json = json.dumps(payload) + "\n"
-    request_bytes = request_json.encode("utf-8")
+    return cast(UEResponse, await _rpc(payload, ctx, timeout_ms))
 
-    # Call with timeout
-    timeout_sec = ctx["timeout_ms"] / 1000
 
+async def call_ue_batch(
+    requests: list[tuple[str, dict[str, Any]]],
+    ctx: ToolContext,
+    *,
+    timeout_ms: int | None = None,
+) -> list[UEResponse]:
+    """
+    Call several UE RPC operations in a single round trip.
+
+    Args:
+        requests: (op, params) pairs
+        ctx: Tool context with host, port, timeout
+        timeout_ms: Override ctx["timeout_ms"] for this call only
+
+    Returns:
+        Responses in the same order as requests
+
+    Raises:
+        Same as call_ue(). ValueError also if the server does not reply
+        with a JSON array.
+
+    Protocol:
+        Request:  [{"id": "cli-1", "op": "ping"}, {"id": "cli-2", "op": "ping"}]
+        Response: [{"id": "cli-1", "op": "ping", "ok": true, ...}, ...]
+    """
+    if not requests:
+        return []
+
+    payload: list[dict[str, Any]] = [
+        {"id": _generate_request_id(), "op": op, **params} for op, params in requests
+    ]
+
+    if timeout_ms is None:
+        timeout_ms = ctx["timeout_ms"]
+
+    responses = await _rpc(payload, ctx, timeout_ms)
+    if not isinstance(responses, list):
+        raise ValueError(f"Expected JSON array for batch request from UE server, got: {responses}")
+
+    # Server may answer in any order - match by id
+    by_id = {resp.get("id"): resp for resp in responses if isinstance(resp, dict)}
+
+    results: list[UEResponse] = []
+    for item in payload:
+        resp = by_id.get(item["id"])
+        if resp is None:
+            resp = {
+                "id": item["id"],
+                "op": item["op"],
+                "ok": False,
+                "error": "No response for request in batch",
+            }
+        results.append(resp)
+
+    return results
+
+
+@contextmanager
+def blocking_requests() -> Iterator[None]:
+    """
+    Send call_ue() requests made inside the block over blocking sockets.
+
+    For one-shot callers (the CLI) where a single request runs at a time:
+    there is nothing to overlap, and the asyncio transport setup is pure
+    overhead. Nothing is pooled, so no close_ue_client() is needed.
+
+    Example:
+        with blocking_requests():
+            result = await ue_ping({}, ctx)
+    """
+    token = _blocking_io.set(True)
     try:
-        # Create TCP connection
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(ctx["host"], ctx["port"]),
-            timeout=timeout_sec,
-        )
+        yield
+    finally:
+        _blocking_io.reset(token)
+
+
+async def gather_ue(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """
+    Run coroutines concurrently, batching their call_ue() requests.
+
+    Works like asyncio.gather(), but call_ue() calls issued by the coroutines
+    in the same event loop tick are sent as one call_ue_batch() request per
+    server. A batch uses the smallest timeout_ms of its requests.
 
+    Example:
+        ping, health = await gather_ue(ue_ping({}, ctx), ue_health({}, ctx))
+    """
+    token = _active_batcher.set(_RequestBatcher())
+    try:
+        # Tasks copy the current context, so they see the batcher
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+    finally:
+        _active_batcher.reset(token)
+
+    return list(await asyncio.gather(*tasks))
+
+
+# (op, params, ctx, timeout_ms, future) queued by _RequestBatcher
+_BatchEntry = tuple[str, dict[str, Any], ToolContext, int, "asyncio.Future[UEResponse]"]
+
+
+class _RequestBatcher:
+    """Collects call_ue() requests issued in one loop tick and sends them together."""
+
+    def __init__(self) -> None:
+        self._queue: list[_BatchEntry] = []
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def submit(
+        self, op: str, params: dict[str, Any], ctx: ToolContext, timeout_ms: int
+    ) -> asyncio.Future[UEResponse]:
+        """Queue request; flush is scheduled after the current tick."""
+        loop = asyncio.get_running_loop()
+        if not self._queue:
+            loop.call_soon(self._start_flush)
+
+        future: asyncio.Future[UEResponse] = loop.create_future()
+        self._queue.append((op, params, ctx, timeout_ms, future))
+        return future
+
+    def _start_flush(self) -> None:
+        queue, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._flush(queue))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, queue: list[_BatchEntry]) -> None:
+        # One batch per target server, sent concurrently
+        groups: dict[tuple[str, int], list[_BatchEntry]] = {}
+        for entry in queue:
+            _, _, entry_ctx, _, _ = entry
+            groups.setdefault((entry_ctx["host"], entry_ctx["port"]), []).append(entry)
+
+        await asyncio.gather(*(self._send_group(entries) for entries in groups.values()))
+
+    @staticmethod
+    async def _send_group(entries: list[_BatchEntry]) -> None:
+        """Send entries for one server and resolve their futures (never raises)."""
+        _, _, ctx, _, _ = entries[0]
+        # Shared round trip - the tightest requested timeout applies to all
+        timeout_ms = min(entry_timeout_ms for _, _, _, entry_timeout_ms, _ in entries)
         try:
-            # Send request
-            writer.write(request_bytes)
-            await writer.drain()
-
-            # Receive response (read until newline)
-            response_bytes = await asyncio.wait_for(
-                reader.readline(),
-                timeout=timeout_sec,
-            )
-
-            response_data = response_bytes.decode("utf-8").strip()
-
-            # Parse JSON
-            try:
-                return cast(UEResponse, json.loads(response_data))
-            except json.JSONDecodeError as err:
-                raise ValueError(f"Invalid JSON from UE server: {err}") from err
-
-        finally:
-            # Clean up connection
-            writer.close()
-            await writer.wait_closed()
+            if len(entries) == 1:
+                op, params, _, _, _ = entries[0]
+                responses = [await _call_ue_now(op, params, ctx, timeout_ms)]
+            else:
+                responses = await call_ue_batch(
+                    [(op, params) for op, params, _, _, _ in entries],
+                    ctx,
+                    timeout_ms=timeout_ms,
+                )
+        except Exception as err:
+            for *_, future in entries:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for (*_, future), resp in zip(entries, responses):
+            if not future.done():
+                future.set_result(resp)
+
+
+async def _rpc(payload: Any, ctx: ToolContext, timeout_ms: int) -> Any:
+    """Send one JSON frame (object or batch array) and return the parsed reply."""
+    # Convert to JSON and add newline (line-based protocol)
+    request_bytes = json_codec.dumps(payload) + b"\n"
+
+    # Call with timeout
+    timeout_sec = timeout_ms / 1000
+
+    try:
+        response_bytes = await _send_request(request_bytes, ctx, timeout_sec)
 
     except asyncio.TimeoutError as err:
+        invalidate_port_cache()
         raise TimeoutError(
             f"Timeout after {timeout_sec}s contacting UE RPC at {ctx['host']}:{ctx['port']}. "
             f"Ensure UE5 is running with UEServer plugin enabled."
         ) from err
 
     except (ConnectionRefusedError, OSError) as err:
+        invalidate_port_cache()
         raise ConnectionError(
             f"Cannot reach UE RPC at {ctx['host']}:{ctx['port']}: {err}. "
             f"Ensure UE5 server is running."
         ) from err
 
+    if not response_bytes:
+        raise ValueError(
+            "UE server closed the connection without a response "
+            "(expected one '\\n'-terminated JSON frame)"
+        )
+
+    # Parse JSON straight from bytes
+    try:
+        return json_codec.loads(response_bytes.strip())
+    except ValueError as err:
+        raise ValueError(f"Invalid JSON from UE server: {err}") from err
+
+
+async def close_ue_client(ctx: ToolContext) -> None:
+    """
+    Close idle pooled connections to ctx's server.
+
+    Safe to call multiple times. The next call_ue() opens a new connection.
+    """
+    key = (asyncio.get_running_loop(), ctx["host"], ctx["port"])
+    await _close_connections(_idle_connections.pop(key, []))
+
+
+async def close_ue_connections() -> None:
+    """Close all idle pooled connections (call on shutdown)."""
+    loop = asyncio.get_running_loop()
+    for key in list(_idle_connections):
+        connections = _idle_connections.pop(key)
+        # Connections from a finished event loop cannot be closed from this one
+        if key[0] is loop:
+            await _close_connections(connections)
+
+
+async def _close_connections(connections: list[_Connection]) -> None:
+    """Close connections and wait for their transports to finish."""
+    for _, writer in connections:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass  # Peer already gone, nothing left to clean up
+
+
+async def _send_request(request_bytes: bytes, ctx: ToolContext, timeout_sec: float) -> bytes:
+    """
+    Send one request line and read one response on a pooled connection.
+
+    An idle connection may have been closed by the server meanwhile; in that
+    case reconnect once and retry on a fresh connection.
+    """
+    if _blocking_io.get():
+        return _exchange_blocking(request_bytes, ctx, timeout_sec)
+
+    key = (asyncio.get_running_loop(), ctx["host"], ctx["port"])
+
+    conn = _get_idle_connection(key)
+    if conn is not None:
+        try:
+            response_bytes = await _exchange(request_bytes, conn, timeout_sec)
+        except (ConnectionResetError, BrokenPipeError):
+            response_bytes = b""
+        except BaseException:
+            conn[1].close()
+            raise
+        if response_bytes:
+            _release_connection(key, conn)
+            return response_bytes
+
+        # Stale pooled connection - fall through to a fresh one
+        conn[1].close()
+
+    conn = await _open_connection(ctx, timeout_sec)
+    try:
+        response_bytes = await _exchange(request_bytes, conn, timeout_sec)
+    except BaseException:
+        # Stream state is unknown after a failed exchange - never reuse it
+        conn[1].close()
+        raise
+
+    _release_connection(key, conn)
+    return response_bytes
+
+
+async def _open_connection(ctx: ToolContext, timeout_sec: float) -> _Connection:
+    """Open a new connection to ctx's server."""
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(ctx["host"], ctx["port"], limit=_MAX_RESPONSE_BYTES),
+        timeout=timeout_sec,
+    )
+    _tune_socket(writer)
+    return reader, writer
+
+
+def _get_idle_connection(
+    key: tuple[asyncio.AbstractEventLoop, str, int],
+) -> _Connection | None:
+    """Take an idle connection that can still carry a request, if any."""
+    idle = _idle_connections.get(key)
+    while idle:
+        reader, writer = idle.pop()
+        if not writer.is_closing() and not reader.at_eof():
+            return reader, writer
+        writer.close()
+    return None
+
+
+def _release_connection(
+    key: tuple[asyncio.AbstractEventLoop, str, int], conn: _Connection
+) -> None:
+    """Return connection to the idle pool, or close it if the server closed it."""
+    reader, writer = conn
+    idle = _idle_connections.setdefault(key, [])
+    # UE server closes after each response - EOF means the connection is done
+    if reader.at_eof() or writer.is_closing() or len(idle) >= _MAX_IDLE_PER_SERVER:
+        writer.close()
+        return
+    idle.append(conn)
+
+
+async def _exchange(request_bytes: bytes, conn: _Connection, timeout_sec: float) -> bytes:
+    """Write request and read response line on a checked-out connection."""
+    reader, writer = conn
+
+    # Send request
+    writer.write(request_bytes)
+    await writer.drain()
+
+    # Receive response (read until newline)
+    try:
+        response_bytes = await asyncio.wait_for(
+            reader.readuntil(b"\n"),
+            timeout=timeout_sec,
+        )
+    except asyncio.IncompleteReadError as err:
+        # UE server may close right after the response instead of sending "\n"
+        response_bytes = err.partial
+    except asyncio.LimitOverrunError as err:
+        raise ValueError(
+            f"UE response exceeds {_MAX_RESPONSE_BYTES} bytes without a '\\n' frame terminator"
+        ) from err
+
+    return response_bytes
+
+
+def _exchange_blocking(request_bytes: bytes, ctx: ToolContext, timeout_sec: float) -> bytes:
+    """
+    Send request and read response on a plain blocking socket.
+
+    Used inside blocking_requests() (one-shot CLI calls), where nothing else
+    runs on the event loop and the asyncio transport/protocol setup is pure
+    overhead.
+    """
+    with socket.create_connection((ctx["host"], ctx["port"]), timeout=timeout_sec) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(request_bytes)
+
+        # Read until newline, or EOF (UE server closes after each response)
+        chunks: list[bytes] = []
+        received = 0
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                chunks.append(chunk[: newline + 1])
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+            if received > _MAX_RESPONSE_BYTES:
+                raise ValueError(
+                    f"UE response exceeds {_MAX_RESPONSE_BYTES} bytes "
+                    "without a '\\n' frame terminator"
+                )
+
+    return b"".join(chunks)
+
+
+def _tune_socket(writer: asyncio.StreamWriter) -> None:
+    """
+    Set socket options for the RPC connection.
+
+    TCP_NODELAY: the protocol is strict request/response with each request
+    written as one line, so Nagle's algorithm can only delay it. (asyncio's
+    own transports already set this; it is set explicitly for other loops.)
+    SO_KEEPALIVE: lets the OS detect a dead peer on a persistent connection.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError:
+        pass  # Options are an optimization - the connection works without them
+
 
 def _generate_request_id() -> str:
-    """Generate unique request ID."""
-    return f"cli-{uuid.uuid4().hex[:12]}"
+    """Generate unique request ID (unique per process, PID keeps processes apart)."""
+    return f"{_REQUEST_ID_PREFIX}{next(_request_counter):x}"
@@ -1,8 +1,13 @@
-"""Tool handlers for UE Bridge."""
+"""Tool handlers for UE Bridge.
 
-from typing import Any, cast
+Handlers import tcp_client on first call so that listing tools (or printing
+CLI help) does not pay for asyncio at import time.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
-from .tcp_client import call_ue
 from .types import ToolContext, ToolHandler, UEResponse
 
 
@@ -18,6 +23,8 @@ async def ue_ping(args: dict[str, Any], ctx: ToolContext) -> UEResponse:
         Response from UE server:
             {"id": "...", "op": "ping", "ok": true, "version": "0.1.0"}
     """
+    from .tcp_client import call_ue
+
     return await call_ue("ping", {}, ctx)
 
 
@@ -35,11 +42,11 @@ async def ue_health(args: dict[str, Any], ctx: ToolContext) -> UEResponse:
         Response from UE server or error if unreachable:
             {"ok": true, "status": "healthy"} or {"ok": false, "error": "..."}
     """
-    # Override timeout to 500ms for quick health check
-    health_ctx = cast(ToolContext, {**ctx, "timeout_ms": 500})
+    from .tcp_client import call_ue
 
     try:
-        response = await call_ue("ping", {}, health_ctx)
+        # Override timeout to 500ms for quick health check
+        response = await call_ue("ping", {}, ctx, timeout_ms=500)
         return {
             "ok": True,
             "status": "healthy",
@@ -53,10 +60,20 @@ async def ue_health(args: dict[str, Any], ctx: ToolContext) -> UEResponse:
         }
 
 
-# Tool registry
-TOOL_HANDLERS: dict[str, ToolHandler] = {
+# Tool registry (read-only - add tools here and to TOOL_NAMES)
+TOOL_HANDLERS: Mapping[str, ToolHandler] = MappingProxyType({
     "ue.ping": ue_ping,
     "ue.health": ue_health,
-}
+})
+
+# Sorted tool names, spelled out so import does no work
+TOOL_NAMES: tuple[str, ...] = ("ue.health", "ue.ping")
+
+
+def _check_registry() -> None:
+    """Ensure TOOL_NAMES matches TOOL_HANDLERS (skipped with python -O)."""
+    assert tuple(sorted(TOOL_HANDLERS)) == TOOL_NAMES, "TOOL_NAMES out of sync with TOOL_HANDLERS"
+
 
-TOOL_NAMES = sorted(TOOL_HANDLERS.keys())
+if __debug__:
+    _check_registry()
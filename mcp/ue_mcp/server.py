@@ -10,10 +10,9 @@ Architecture:
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Sequence, cast
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -27,8 +26,9 @@ try:
     if str(bridge_path) not in sys.path:
         sys.path.insert(0, str(bridge_path))
 
+    from ue_bridge import json_codec
     from ue_bridge.port_discovery import discover_port
-    from ue_bridge.tcp_client import create_ue_client
+    from ue_bridge.tcp_client import close_ue_connections, create_ue_client
     from ue_bridge.tools import TOOL_HANDLERS, TOOL_NAMES
 except ImportError as e:
     print(f"ERROR: Cannot import ue_bridge: {e}", file=sys.stderr)
@@ -36,6 +36,18 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Startup banner tool list (TOOL_NAMES is a literal tuple, fixed at import)
+_TOOL_NAMES_STR = ", ".join(TOOL_NAMES)
+
+# Port discovery failure envelope; only the error string varies per call
+_PORT_FAIL_TEMPLATE = '{"ok":false,"error":%s}'
+
+
+def _json_text(obj: Any) -> str:
+    """Serialize obj as compact JSON for MCP text content (TextContent.text is str)."""
+    return cast(str, json_codec.dumps_str(obj))
+
+
 def start_server() -> None:
     """
     Start the MCP server on stdio.
@@ -80,19 +92,21 @@ def start_server() -> None:
         This is the ONLY logic in MCP: serialize bridge response to MCP format.
         Everything else (port discovery, TCP, RPC) is in bridge.
         """
-        handler = TOOL_HANDLERS.get(name)
-        if not handler:
-            return [TextContent(type="text", text=json.dumps({"ok": False, "error": f"Unknown tool: {name}"}))]
+        try:
+            handler = TOOL_HANDLERS[name]
+        except KeyError:
+            error_json = _json_text({"ok": False, "error": f"Unknown tool: {name}"})
+            return [TextContent(type="text", text=error_json)]
 
         try:
             # Discover port - bridge handles all the logic
             port_result = discover_port()
             if not port_result.get("ok"):
                 error_msg = port_result.get("error", "Port discovery failed")
-                error_json = json.dumps({"ok": False, "error": error_msg})
+                error_json = _PORT_FAIL_TEMPLATE % _json_text(error_msg)
                 return [TextContent(type="text", text=error_json)]
 
-            # Create context
+            # Create context - connections are pooled by tcp_client
             client = create_ue_client(
                 port=port_result["port"],
                 host="127.0.0.1",
@@ -104,7 +118,7 @@ def start_server() -> None:
             result = await handler(arguments or {}, ctx)
 
             # Return as MCP text content
-            return [TextContent(type="text", text=json.dumps(result))]
+            return [TextContent(type="text", text=_json_text(result))]
 
         except Exception as e:
             error_response = {
@@ -112,18 +126,21 @@ def start_server() -> None:
                 "error": str(e),
                 "hint": "Ensure UE5 is running with UEServer plugin enabled",
             }
-            return [TextContent(type="text", text=json.dumps(error_response))]
+            return [TextContent(type="text", text=_json_text(error_response))]
 
     print(f"[ue-mcp] Starting MCP server with {len(TOOL_NAMES)} tools", file=sys.stderr)
-    print(f"[ue-mcp] Tools: {', '.join(TOOL_NAMES)}", file=sys.stderr)
+    print(f"[ue-mcp] Tools: {_TOOL_NAMES_STR}", file=sys.stderr)
 
     # Start stdio transport
     async def run_server() -> None:
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream,
-                write_stream,
-                server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+        finally:
+            await close_ue_connections()
 
     asyncio.run(run_server())
@@ -356,31 +356,39 @@ void FUEServerRPC::HandleClient(FSocket* ClientSocket)
 		return;
 	}
 
-	// Receive data
+	// Receive data until newline (line-based protocol) - batch requests can exceed one chunk
 	const int32 BufferSize = 4096;
+	const int32 MaxRequestSize = 1024 * 1024;
 	uint8 Buffer[BufferSize];
 	int32 BytesRead = 0;
+	TArray<uint8> RequestData;
 
-	if (ClientSocket->Recv(Buffer, BufferSize - 1, BytesRead))
+	while (RequestData.Num() < MaxRequestSize && ClientSocket->Recv(Buffer, BufferSize, BytesRead) && BytesRead > 0)
 	{
-		if (BytesRead > 0)
+		RequestData.Append(Buffer, BytesRead);
+		if (TArrayView<const uint8>(Buffer, BytesRead).Contains('\n'))
 		{
-			// Null-terminate and convert to FString
-			Buffer[BytesRead] = 0;
-			FString RequestJson = FString(UTF8_TO_TCHAR(Buffer));
+			break;
+		}
+	}
 
-			UE_LOG(LogTemp, Log, TEXT("UEServerRPC: Received request: %s"), *RequestJson);
+	if (RequestData.Num() > 0)
+	{
+		// Null-terminate and convert to FString
+		RequestData.Add(0);
+		FString RequestJson = FString(UTF8_TO_TCHAR(reinterpret_cast<const ANSICHAR*>(RequestData.GetData())));
 
-			// Process request
-			FString ResponseJson = ProcessRequest(RequestJson);
+		UE_LOG(LogTemp, Log, TEXT("UEServerRPC: Received request: %s"), *RequestJson);
 
-			// Send response
-			const FTCHARToUTF8 Converter(*ResponseJson);
-			int32 BytesSent = 0;
-			ClientSocket->Send((const uint8*)Converter.Get(), Converter.Length(), BytesSent);
+		// Process request
+		FString ResponseJson = ProcessRequest(RequestJson);
 
-			UE_LOG(LogTemp, Log, TEXT("UEServerRPC: Sent response: %s"), *ResponseJson);
-		}
+		// Send response
+		const FTCHARToUTF8 Converter(*ResponseJson);
+		int32 BytesSent = 0;
+		ClientSocket->Send((const uint8*)Converter.Get(), Converter.Length(), BytesSent);
+
+		UE_LOG(LogTemp, Log, TEXT("UEServerRPC: Sent response: %s"), *ResponseJson);
 	}
 
 	// Close client socket
@@ -390,6 +398,12 @@ void FUEServerRPC::HandleClient(FSocket* ClientSocket)
 
 FString FUEServerRPC::ProcessRequest(const FString& RequestJson)
 {
+	// Batch request: JSON array of requests, answered with a JSON array of responses
+	if (RequestJson.TrimStart().StartsWith(TEXT("[")))
+	{
+		return ProcessBatchRequest(RequestJson);
+	}
+
 	// Parse JSON
 	TSharedPtr<FJsonObject> JsonObject;
 	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(RequestJson);
@@ -402,11 +416,54 @@ FString FUEServerRPC::ProcessRequest(const FString& RequestJson)
 		ErrorResponse->SetStringField(TEXT("error"), TEXT("Invalid JSON"));
 
 		FString OutputString;
-		TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+		TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer =
+			TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&OutputString);
 		FJsonSerializer::Serialize(ErrorResponse.ToSharedRef(), Writer);
 		return OutputString;
 	}
 
+	return ProcessRequestObject(JsonObject);
+}
+
+FString FUEServerRPC::ProcessBatchRequest(const FString& RequestJson)
+{
+	TArray<TSharedPtr<FJsonValue>> Requests;
+	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(RequestJson);
+
+	if (!FJsonSerializer::Deserialize(Reader, Requests))
+	{
+		// Return error response
+		TSharedPtr<FJsonObject> ErrorResponse = MakeShared<FJsonObject>();
+		ErrorResponse->SetBoolField(TEXT("ok"), false);
+		ErrorResponse->SetStringField(TEXT("error"), TEXT("Invalid JSON"));
+
+		FString OutputString;
+		TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer =
+			TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&OutputString);
+		FJsonSerializer::Serialize(ErrorResponse.ToSharedRef(), Writer);
+		return OutputString;
+	}
+
+	// Process each request in order; each response is a single-line JSON object
+	TArray<FString> Responses;
+	for (const TSharedPtr<FJsonValue>& Value : Requests)
+	{
+		const TSharedPtr<FJsonObject>* RequestObject = nullptr;
+		if (Value.IsValid() && Value->TryGetObject(RequestObject) && RequestObject->IsValid())
+		{
+			Responses.Add(ProcessRequestObject(*RequestObject));
+		}
+		else
+		{
+			Responses.Add(TEXT("{\"ok\":false,\"error\":\"Invalid request in batch\"}"));
+		}
+	}
+
+	return FString::Printf(TEXT("[%s]"), *FString::Join(Responses, TEXT(",")));
+}
+
+FString FUEServerRPC::ProcessRequestObject(const TSharedPtr<FJsonObject>& JsonObject)
+{
 	// Get operation
 	FString Op = JsonObject->GetStringField(TEXT("op"));
 
@@ -422,8 +479,10 @@ FString FUEServerRPC::ProcessRequest(const FString& RequestJson)
 	ErrorResponse->SetStringField(TEXT("op"), Op);
 	ErrorResponse->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown operation: %s"), *Op));
 
+	// Serialize (compact, single-line JSON)
 	FString OutputString;
-	TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+	TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer =
+		TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&OutputString);
 	FJsonSerializer::Serialize(ErrorResponse.ToSharedRef(), Writer);
 	return OutputString;
 }
@@ -54,9 +54,15 @@ private:
 	/** Handle incoming client connection */
 	void HandleClient(FSocket* ClientSocket);
 
-	/** Process a single RPC request */
+	/** Process a single RPC request (or a JSON array batch of requests) */
 	FString ProcessRequest(const FString& RequestJson);
 
+	/** Process a JSON array of RPC requests, returning a JSON array of responses */
+	FString ProcessBatchRequest(const FString& RequestJson);
+
+	/** Route a parsed RPC request to its operation handler */
+	FString ProcessRequestObject(const TSharedPtr<FJsonObject>& JsonObject);
+
 	/** RPC handler: ping operation */
 	FString HandlePing(const TSharedPtr<FJsonObject>& Request);
 